@@ -39,8 +39,12 @@ target_metadata = Base.metadata # Use the metadata from my Base class
 # ... etc.
 
 def get_url():
-    """Helper function to return the database URL from settings."""
-    return settings.DATABASE_URL
+    """Helper function to return the database URL from settings.
+
+    Alembic runs synchronously, so the asyncpg driver used by the app is
+    swapped for psycopg2 here.
+    """
+    return settings.DATABASE_URL.replace("+asyncpg", "+psycopg2")
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -61,10 +65,12 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
-        # I should include the naming convention here too
-        render_as_batch=True, # Recommended for SQLite, generally safe
+        # Batch mode ("move and copy") is only needed on SQLite, which can't
+        # ALTER in place; on Postgres it would turn every ALTER into a
+        # lock-heavy full-table recreate.
+        render_as_batch=url.startswith("sqlite"),
         compare_type=True,    # Detect column type changes
-        include_schemas=True, # If using multiple schemas
+        include_schemas=False, # Single-schema service; skip reflecting the rest
         # Use the same naming convention as in base_class.py
         # This might require defining the convention dict here or importing it
         # For simplicity, relying on metadata's convention for now, but might need explicit set.
@@ -98,10 +104,11 @@ def run_migrations_online() -> None:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
-            # Match offline configuration options
-            render_as_batch=True,
+            # Match offline configuration options: batch mode only where the
+            # dialect actually requires it (SQLite).
+            render_as_batch=connection.dialect.name == "sqlite",
             compare_type=True,
-            include_schemas=True,
+            include_schemas=False,
             # naming_convention=Base.metadata.naming_convention
         )
 
@@ -0,0 +1,29 @@
+"""server_side_uuid_default_for_users
+
+Revision ID: 03b4c5d6e7f8
+Revises: 9203b4c5d6e7
+Create Date: YYYY-MM-DD HH:MM:SS.MS
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '03b4c5d6e7f8'
+down_revision = '9203b4c5d6e7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Let Postgres mint user ids in the INSERT itself (pgcrypto's
+    # gen_random_uuid) instead of the client pulling from os.urandom and
+    # shipping the value over the wire; inserts that omit id get one back
+    # via RETURNING. Existing rows are untouched.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    op.execute("ALTER TABLE users ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE users ALTER COLUMN id DROP DEFAULT")
@@ -0,0 +1,143 @@
+"""create_core_auth_tables
+
+Revision ID: 091a2b3c4d5e
+Revises:
+Create Date: YYYY-MM-DD HH:MM:SS.MS
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = '091a2b3c4d5e'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Base schema for the auth service. These tables were historically
+    # created by Base.metadata.create_all at import time; now that every
+    # service bootstraps through `alembic upgrade head`, a fresh database
+    # needs them minted here before 1a2b3c4d5e6f starts ALTERing users.
+    # Guarded with has_table because existing deployments already carry
+    # them (same pattern as 5e6f70819203 / 819203b4c5d6). Email starts as
+    # VARCHAR; 2b3c4d5e6f70 converts it to CITEXT further down the chain.
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    if not inspector.has_table('users'):
+        op.create_table(
+            'users',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('email', sa.String(255), nullable=False),
+            sa.Column('username', sa.String(100), nullable=False),
+            sa.Column('hashed_password', sa.String(255), nullable=False),
+            # simple_auth.py reads and writes a role string; the app package
+            # manages roles relationally and just ignores this column.
+            sa.Column('role', sa.String(50), nullable=False, server_default='user'),
+            sa.Column('is_active', sa.Boolean(), nullable=False),
+            # Server defaults so inserts from models that omit these columns
+            # (simple_auth has no is_verified) still satisfy NOT NULL.
+            sa.Column('is_verified', sa.Boolean(), nullable=False, server_default=sa.false()),
+            sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+            sa.Column('last_login_at', sa.DateTime(timezone=True), nullable=True),
+        )
+        op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+        op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=True)
+
+    if not inspector.has_table('roles'):
+        op.create_table(
+            'roles',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('name', sa.String(50), nullable=False),
+            sa.Column('description', sa.String(255), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), nullable=True, server_default=sa.func.now()),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True, server_default=sa.func.now()),
+        )
+        op.create_index(op.f('ix_roles_name'), 'roles', ['name'], unique=True)
+
+    if not inspector.has_table('permissions'):
+        op.create_table(
+            'permissions',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('name', sa.String(100), nullable=False),
+            sa.Column('description', sa.String(255), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), nullable=True, server_default=sa.func.now()),
+        )
+        op.create_index(op.f('ix_permissions_name'), 'permissions', ['name'], unique=True)
+
+    if not inspector.has_table('user_roles'):
+        op.create_table(
+            'user_roles',
+            sa.Column('user_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+            sa.Column('role_id', UUID(as_uuid=True), sa.ForeignKey('roles.id', ondelete='CASCADE'), primary_key=True),
+        )
+
+    if not inspector.has_table('role_permissions'):
+        op.create_table(
+            'role_permissions',
+            sa.Column('role_id', UUID(as_uuid=True), sa.ForeignKey('roles.id', ondelete='CASCADE'), primary_key=True),
+            sa.Column('permission_id', UUID(as_uuid=True), sa.ForeignKey('permissions.id', ondelete='CASCADE'), primary_key=True),
+        )
+
+    if not inspector.has_table('user_profiles'):
+        op.create_table(
+            'user_profiles',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('user_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('first_name', sa.String(100), nullable=True),
+            sa.Column('last_name', sa.String(100), nullable=True),
+            sa.Column('bio', sa.Text(), nullable=True),
+            sa.Column('avatar_url', sa.String(255), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), nullable=True, server_default=sa.func.now()),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True, server_default=sa.func.now()),
+        )
+        op.create_index(op.f('ix_user_profiles_user_id'), 'user_profiles', ['user_id'], unique=True)
+
+    if not inspector.has_table('user_api_keys'):
+        op.create_table(
+            'user_api_keys',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('user_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('key_name', sa.String(100), nullable=False),
+            sa.Column('prefix', sa.String(8), nullable=False),
+            sa.Column('hashed_key', sa.String(64), nullable=False),
+            sa.Column('scopes', sa.Text(), nullable=True),
+            sa.Column('expires_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('last_used_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('is_active', sa.Boolean(), nullable=False),
+            sa.Column('created_at', sa.DateTime(timezone=True), nullable=True, server_default=sa.func.now()),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True, server_default=sa.func.now()),
+            sa.UniqueConstraint('prefix', name='uq_user_api_keys_prefix'),
+            sa.UniqueConstraint('hashed_key', name='uq_user_api_keys_hashed_key'),
+        )
+        op.create_index(op.f('ix_user_api_keys_user_id'), 'user_api_keys', ['user_id'])
+        op.create_index('ix_user_api_keys_user_id_key_name', 'user_api_keys', ['user_id', 'key_name'], unique=True)
+
+    if not inspector.has_table('login_history'):
+        op.create_table(
+            'login_history',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('user_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('login_timestamp', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+            sa.Column('ip_address', sa.String(45), nullable=True),
+            sa.Column('user_agent', sa.String(512), nullable=True),
+            sa.Column('login_successful', sa.Boolean(), nullable=False),
+            sa.Column('failure_reason', sa.String(255), nullable=True),
+        )
+        op.create_index(op.f('ix_login_history_user_id'), 'login_history', ['user_id'])
+
+
+def downgrade() -> None:
+    op.drop_table('login_history')
+    op.drop_table('user_api_keys')
+    op.drop_table('user_profiles')
+    op.drop_table('role_permissions')
+    op.drop_table('user_roles')
+    op.drop_table('permissions')
+    op.drop_table('roles')
+    op.drop_table('users')
@@ -1,7 +1,7 @@
 """add_wallet_and_financial_fields_to_user
 
 Revision ID: 1a2b3c4d5e6f
-Revises: 
+Revises: 091a2b3c4d5e
 Create Date: YYYY-MM-DD HH:MM:SS.MS
 
 """
@@ -11,7 +11,7 @@ import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision = '1a2b3c4d5e6f'
-down_revision = None  # This is the first migration
+down_revision = '091a2b3c4d5e'
 branch_labels = None
 depends_on = None
 
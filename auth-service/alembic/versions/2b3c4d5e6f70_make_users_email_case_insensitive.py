@@ -0,0 +1,28 @@
+"""make_users_email_case_insensitive
+
+Revision ID: 2b3c4d5e6f70
+Revises: 1a2b3c4d5e6f
+Create Date: YYYY-MM-DD HH:MM:SS.MS
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2b3c4d5e6f70'
+down_revision = '1a2b3c4d5e6f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CITEXT makes email equality case-insensitive at the type level, so the
+    # unique index is usable without LOWER() on either side of the compare.
+    # Existing values are normalized to lowercase on the way over.
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE CITEXT USING lower(email)")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE VARCHAR(255)")
@@ -0,0 +1,47 @@
+"""add_dashboard_hot_path_indexes
+
+Revision ID: 4d5e6f708192
+Revises: 5e6f70819203
+Create Date: YYYY-MM-DD HH:MM:SS.MS
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4d5e6f708192'
+down_revision = '5e6f70819203'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The dashboard filters jobs by (user_id, status) ordered by
+    # created_at DESC, transactions by (user_id, transaction_type) with the
+    # same ordering, and providers by status = 'online'. Without these the
+    # planner falls back to sequential scans plus an explicit sort on every
+    # dashboard load. This revision runs after 5e6f70819203 so the tables
+    # exist on a fresh database; IF NOT EXISTS covers deployments whose
+    # create_all-era schema already carried equivalent indexes.
+    # CONCURRENTLY can't run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_user_status_created "
+            "ON jobs (user_id, status, created_at DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tx_user_type_created "
+            "ON transactions (user_id, transaction_type, created_at DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_providers_online "
+            "ON providers (status) WHERE status = 'online'"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_providers_online")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tx_user_type_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_user_status_created")
@@ -0,0 +1,107 @@
+"""create_dashboard_tables
+
+Revision ID: 5e6f70819203
+Revises: 3c4d5e6f7081
+Create Date: YYYY-MM-DD HH:MM:SS.MS
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = '5e6f70819203'
+down_revision = '3c4d5e6f7081'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # These tables used to be created by Base.metadata.create_all at
+    # dashboard_service import time (once per worker, every boot). Guarded
+    # with has_table because existing deployments already carry them.
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    if not inspector.has_table('providers'):
+        op.create_table(
+            'providers',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('owner_id', UUID(as_uuid=True), nullable=False),
+            sa.Column('name', sa.String(), nullable=False),
+            sa.Column('location', sa.String(), nullable=True),
+            sa.Column('status', sa.String(), nullable=True),
+            sa.Column('hostname', sa.String(), nullable=True),
+            sa.Column('ip_address', sa.String(), nullable=True),
+            sa.Column('hourly_rate', sa.Float(), nullable=True),
+            sa.Column('rating', sa.Float(), nullable=True),
+            sa.Column('total_jobs', sa.Integer(), nullable=True),
+            sa.Column('success_rate', sa.Float(), nullable=True),
+            sa.Column('gpus_data', sa.JSON(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column('last_seen_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+
+    if not inspector.has_table('jobs'):
+        op.create_table(
+            'jobs',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('user_id', UUID(as_uuid=True), nullable=False),
+            sa.Column('provider_id', UUID(as_uuid=True), nullable=False),
+            sa.Column('name', sa.String(), nullable=False),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('status', sa.String(), nullable=True),
+            sa.Column('gpu_model', sa.String(), nullable=False),
+            sa.Column('cost_dgpu', sa.Float(), nullable=True),
+            sa.Column('duration_seconds', sa.Integer(), nullable=True),
+            sa.Column('progress_percentage', sa.Float(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('requirements', sa.JSON(), nullable=True),
+            sa.Column('execution_config', sa.JSON(), nullable=True),
+            sa.Column('metrics_data', sa.JSON(), nullable=True),
+        )
+
+    if not inspector.has_table('transactions'):
+        op.create_table(
+            'transactions',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('user_id', UUID(as_uuid=True), nullable=False),
+            sa.Column('transaction_type', sa.String(), nullable=False),
+            sa.Column('amount', sa.Float(), nullable=False),
+            sa.Column('description', sa.String(), nullable=False),
+            sa.Column('status', sa.String(), nullable=True),
+            sa.Column('tx_hash', sa.String(), nullable=True),
+            sa.Column('from_address', sa.String(), nullable=True),
+            sa.Column('to_address', sa.String(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        )
+
+    if not inspector.has_table('gpu_metrics'):
+        op.create_table(
+            'gpu_metrics',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('provider_id', UUID(as_uuid=True), nullable=False),
+            sa.Column('gpu_index', sa.Integer(), nullable=True),
+            sa.Column('utilization_gpu', sa.Float(), nullable=True),
+            sa.Column('utilization_memory', sa.Float(), nullable=True),
+            sa.Column('temperature', sa.Float(), nullable=True),
+            sa.Column('power_draw', sa.Float(), nullable=True),
+            sa.Column('memory_used_mb', sa.Integer(), nullable=True),
+            sa.Column('memory_total_mb', sa.Integer(), nullable=True),
+            sa.Column('clock_graphics_mhz', sa.Integer(), nullable=True),
+            sa.Column('clock_memory_mhz', sa.Integer(), nullable=True),
+            sa.Column('fan_speed_percent', sa.Float(), nullable=True),
+            sa.Column('is_healthy', sa.Boolean(), nullable=True),
+            sa.Column('timestamp', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('gpu_metrics')
+    op.drop_table('transactions')
+    op.drop_table('jobs')
+    op.drop_table('providers')
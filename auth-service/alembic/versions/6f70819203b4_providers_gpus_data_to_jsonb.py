@@ -0,0 +1,45 @@
+"""providers_gpus_data_to_jsonb
+
+Revision ID: 6f70819203b4
+Revises: 4d5e6f708192
+Create Date: YYYY-MM-DD HH:MM:SS.MS
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '6f70819203b4'
+down_revision = '4d5e6f708192'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # json -> jsonb: binary storage with server-side operators, so GPU
+    # counts can be aggregated as jsonb_array_length(gpus_data) in SQL
+    # instead of shipping every array to Python.
+    op.alter_column(
+        'providers',
+        'gpus_data',
+        type_=postgresql.JSONB(),
+        postgresql_using='gpus_data::jsonb',
+    )
+    # Functional partial index so online GPU-count aggregates read the
+    # precomputed lengths straight out of the index.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_providers_gpu_count "
+        "ON providers ((jsonb_array_length(gpus_data))) WHERE status = 'online'"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_providers_gpu_count")
+    op.alter_column(
+        'providers',
+        'gpus_data',
+        type_=postgresql.JSON(),
+        postgresql_using='gpus_data::json',
+    )
@@ -0,0 +1,60 @@
+"""dashboard_status_columns_to_native_enums
+
+Revision ID: 70819203b4c5
+Revises: 6f70819203b4
+Create Date: YYYY-MM-DD HH:MM:SS.MS
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '70819203b4c5'
+down_revision = '6f70819203b4'
+branch_labels = None
+depends_on = None
+
+
+_ENUMS = {
+    'job_status': ('pending', 'running', 'completed', 'failed', 'cancelled'),
+    'transaction_type': ('payment', 'earning', 'refund', 'deposit', 'withdrawal'),
+    'transaction_status': ('pending', 'completed', 'failed'),
+    'provider_status': ('online', 'offline', 'busy', 'maintenance'),
+}
+
+_COLUMNS = (
+    ('jobs', 'status', 'job_status'),
+    ('transactions', 'transaction_type', 'transaction_type'),
+    ('transactions', 'status', 'transaction_status'),
+    ('providers', 'status', 'provider_status'),
+)
+
+
+def upgrade() -> None:
+    # Status/type columns were free-form varchar although the application
+    # only ever writes short enum values. Native enums store a fixed-width
+    # tag per row and compare tags in WHERE/IN filters, which also shrinks
+    # the composite indexes that lead with these columns. Postgres rebuilds
+    # the dependent (partial) indexes as part of ALTER COLUMN TYPE.
+    conn = op.get_bind()
+    for name, values in _ENUMS.items():
+        postgresql.ENUM(*values, name=name).create(conn, checkfirst=True)
+
+    for table, column, enum_name in _COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {enum_name} USING {column}::text::{enum_name}"
+        )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    for table, column, _enum_name in _COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE VARCHAR USING {column}::text"
+        )
+    for name, values in _ENUMS.items():
+        postgresql.ENUM(*values, name=name).drop(conn, checkfirst=True)
@@ -0,0 +1,91 @@
+"""create_gpu_monitor_tables
+
+Revision ID: 819203b4c5d6
+Revises: 70819203b4c5
+Create Date: YYYY-MM-DD HH:MM:SS.MS
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = '819203b4c5d6'
+down_revision = '70819203b4c5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # These tables used to be created by Base.metadata.create_all at
+    # gpu_monitor_service import time, which probed pg_catalog for every
+    # model on every process boot. Guarded with has_table because existing
+    # deployments already carry them.
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    if not inspector.has_table('gpu_devices'):
+        op.create_table(
+            'gpu_devices',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('device_id', sa.String(), nullable=False, unique=True),
+            sa.Column('owner_id', UUID(as_uuid=True), nullable=True),
+            sa.Column('name', sa.String(), nullable=False),
+            sa.Column('vendor', sa.String(), nullable=False),
+            sa.Column('driver_version', sa.String(), nullable=True),
+            sa.Column('memory_total_mb', sa.Integer(), nullable=True),
+            sa.Column('architecture', sa.String(), nullable=True),
+            sa.Column('compute_capability', sa.String(), nullable=True),
+            sa.Column('pcie_gen', sa.Integer(), nullable=True),
+            sa.Column('pcie_width', sa.Integer(), nullable=True),
+            sa.Column('performance_score', sa.Float(), nullable=True),
+            sa.Column('is_available_for_rent', sa.Boolean(), nullable=True),
+            sa.Column('hourly_rate_dgpu', sa.Float(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column('last_seen_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+
+    if not inspector.has_table('gpu_real_metrics'):
+        op.create_table(
+            'gpu_real_metrics',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('device_id', sa.String(), nullable=False),
+            sa.Column('memory_used_mb', sa.Integer(), nullable=True),
+            sa.Column('memory_free_mb', sa.Integer(), nullable=True),
+            sa.Column('utilization_gpu', sa.Float(), nullable=True),
+            sa.Column('utilization_memory', sa.Float(), nullable=True),
+            sa.Column('temperature_c', sa.Float(), nullable=True),
+            sa.Column('power_draw_w', sa.Float(), nullable=True),
+            sa.Column('clock_graphics_mhz', sa.Integer(), nullable=True),
+            sa.Column('clock_memory_mhz', sa.Integer(), nullable=True),
+            sa.Column('fan_speed_rpm', sa.Integer(), nullable=True),
+            sa.Column('timestamp', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+        op.create_index(
+            'ix_gpu_real_metrics_device_ts',
+            'gpu_real_metrics',
+            ['device_id', sa.text('timestamp DESC')],
+        )
+
+    if not inspector.has_table('system_metrics'):
+        op.create_table(
+            'system_metrics',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('hostname', sa.String(), nullable=False),
+            sa.Column('cpu_usage_percent', sa.Float(), nullable=True),
+            sa.Column('ram_used_gb', sa.Float(), nullable=True),
+            sa.Column('ram_total_gb', sa.Float(), nullable=True),
+            sa.Column('disk_used_gb', sa.Float(), nullable=True),
+            sa.Column('disk_total_gb', sa.Float(), nullable=True),
+            sa.Column('network_sent_mb', sa.Float(), nullable=True),
+            sa.Column('network_recv_mb', sa.Float(), nullable=True),
+            sa.Column('uptime_seconds', sa.Integer(), nullable=True),
+            sa.Column('timestamp', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('system_metrics')
+    op.drop_table('gpu_real_metrics')
+    op.drop_table('gpu_devices')
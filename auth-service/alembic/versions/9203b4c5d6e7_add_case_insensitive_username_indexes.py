@@ -0,0 +1,44 @@
+"""add_case_insensitive_username_indexes
+
+Revision ID: 9203b4c5d6e7
+Revises: 819203b4c5d6
+Create Date: YYYY-MM-DD HH:MM:SS.MS
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9203b4c5d6e7'
+down_revision = '819203b4c5d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Email is already case-insensitive at the type level (CITEXT, revision
+    # 2b3c4d5e6f70). Username comparisons still depended on exact case, so
+    # "Admin"/"admin" could coexist and a lower() lookup fell back to a seq
+    # scan. An expression index makes lower(username) = lower(?) an index
+    # lookup and enforces case-insensitive uniqueness; the second index
+    # keeps the login path an index-only scan under the new predicate,
+    # mirroring ix_users_username_active_pw (3c4d5e6f7081), which stays
+    # for the exact-match paths in app/main.py.
+    # CONCURRENTLY can't run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_users_username_lower "
+            "ON users (lower(username))"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_username_lower_active_pw "
+            "ON users (lower(username)) INCLUDE (id, hashed_password, is_active) "
+            "WHERE is_active = true"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_username_lower_active_pw")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_users_username_lower")
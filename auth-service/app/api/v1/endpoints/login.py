@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Any
 
 from app.db.session import get_db
@@ -11,10 +11,10 @@ from app.schemas import user as user_schemas # Alias for clarity
 router = APIRouter()
 
 @router.post("/login", response_model=user_schemas.User)
-def login_for_user_details(
+async def login_for_user_details(
     # I should use OAuth2PasswordRequestForm for standard form data input
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
     I need an endpoint to handle user login and return user details upon success.
@@ -25,8 +25,9 @@ def login_for_user_details(
     - If authentication fails (user not found, inactive, wrong password), raises HTTP 401.
     - If successful, returns the authenticated user's details (User schema).
     """
-    # I should use the authenticate_user CRUD function.
-    user = crud_user.authenticate_user(
+    # I should use the authenticate_user CRUD function; it awaits the
+    # password verification in the dedicated hashing thread pool.
+    user = await crud_user.authenticate_user(
         db, username=form_data.username, password=form_data.password
     )
     if not user:
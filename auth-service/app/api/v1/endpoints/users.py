@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from app.db import crud # Using __init__ perhaps? No, let's be explicit.
 from app.db.crud import crud_user
+from app.db.models.user import User
 from app.schemas import user as user_schemas # Alias to avoid naming conflicts
 from app.db.session import get_db # Dependency to get DB session
 
@@ -11,48 +15,60 @@ from app.db.session import get_db # Dependency to get DB session
 router = APIRouter()
 
 @router.post("/", response_model=user_schemas.User, status_code=status.HTTP_201_CREATED)
-def create_new_user(
+async def create_new_user(
     *, # Makes db and user_in keyword-only arguments
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_in: user_schemas.UserCreate
 ):
     """
     I need an endpoint to create a new user.
 
     - It receives user details in the request body (UserCreate schema).
-    - Checks if a user with the same email or username already exists.
-    - If exists, raises an HTTP 409 Conflict error.
-    - Otherwise, creates the user using the CRUD function.
+    - Inserts the user in a single INSERT ... ON CONFLICT round-trip;
+      the database's unique constraints arbitrate duplicates instead of
+      racy pre-insert SELECTs.
+    - If the username or email is already taken, raises HTTP 409 Conflict.
     - Returns the created user data (User schema).
     """
-    # I should check if a user with this username already exists.
-    existing_user_by_username = crud_user.get_user_by_username(db, username=user_in.username)
-    if existing_user_by_username:
+    try:
+        # Hashing is awaited so it runs in its dedicated process pool
+        # instead of tying up the event loop for the duration.
+        user = await crud_user.create_user_if_absent(db=db, user_in=user_in)
+    except crud_user.UserAlreadyExists as exc:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail="A user with this username already exists.",
+            detail=f"A user with this {exc.field} already exists.",
         )
+    return user
 
-    # I should also check if a user with this email already exists.
-    existing_user_by_email = crud_user.get_user_by_email(db, email=user_in.email)
-    if existing_user_by_email:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="A user with this email already exists.",
-        )
+@router.get("/", response_model=List[user_schemas.User])
+async def read_users(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    skip: int = 0,
+    limit: int = 100,
+    # current_user: models.User = Depends(get_current_active_superuser) # Need dependency for auth
+):
+    """
+    Retrieve users (requires admin privileges - auth not implemented yet).
 
-    # If checks pass, I can create the user.
-    user = crud_user.create_user(db=db, user_in=user_in)
-    return user
+    The response carries a weak ETag derived from the table's newest
+    updated_at plus the row count; when the client's If-None-Match still
+    matches we answer 304 from one cheap aggregate query, skipping both
+    the row fetch and the Pydantic serialization entirely.
+    """
+    # One small aggregate tells us whether anything could have changed.
+    max_updated, count = (
+        await db.execute(select(func.max(User.updated_at), func.count()).select_from(User))
+    ).one()
+
+    version = "empty" if count == 0 else f"{max_updated.timestamp()}:{count}:{skip}:{limit}"
+    etag = 'W/"%s"' % hashlib.blake2b(version.encode(), digest_size=16).hexdigest()
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
 
-# I might add other user endpoints here later (get users, get user by ID, update, delete)
-# @router.get("/", response_model=List[user_schemas.User])
-# def read_users(
-#     db: Session = Depends(get_db),
-#     skip: int = 0,
-#     limit: int = 100,
-#     # current_user: models.User = Depends(get_current_active_superuser) # Need dependency for auth
-# ):
-#     """Retrieve users (requires admin privileges - auth not implemented yet)."""
-#     users = crud_user.get_users(db, skip=skip, limit=limit)
-#     return users 
\ No newline at end of file
+    response.headers["ETag"] = etag
+    users = await crud_user.get_users(db, skip=skip, limit=limit)
+    return users 
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""Emit a frozen, validator-free snapshot of Settings as a Python module.
+
+Build step:
+
+    python -m app.core.freeze_config > app/core/_settings_frozen.py
+
+At runtime get_settings() prefers the snapshot when
+DANTE_USE_FROZEN_SETTINGS=1 is set (production images), which skips
+pydantic-settings' .env parsing and validator resolution entirely on
+cold start. Development keeps the normal pydantic path so .env changes
+are picked up without a rebuild.
+"""
+
+from app.core.config import Settings
+
+_HEADER = '''\
+"""Auto-generated by `python -m app.core.freeze_config`. Do not edit.
+
+A plain frozen dataclass with the resolved configuration values; no
+pydantic, no .env IO, no validators at import time.
+"""
+
+from dataclasses import dataclass
+'''
+
+def _freeze_value(value):
+    """Reduce a settings value to something repr()-roundtrippable."""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, (list, tuple)):
+        # Tuples keep the dataclass default immutable (and hashable).
+        return tuple(_freeze_value(v) for v in value)
+    # AnyHttpUrl, EmailStr and friends all stringify cleanly.
+    return str(value)
+
+def render() -> str:
+    settings = Settings()
+    lines = [_HEADER, "", "@dataclass(frozen=True, slots=True)", "class FrozenSettings:"]
+    for name in type(settings).model_fields:
+        value = _freeze_value(getattr(settings, name))
+        lines.append(f"    {name}: {type(value).__name__} = {value!r}")
+    lines += ["", "", "settings = FrozenSettings()", ""]
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    print(render(), end="")
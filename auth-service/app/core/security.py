@@ -1,15 +1,102 @@
-from passlib.context import CryptContext
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 
-# I need to create a CryptContext instance specifying the hashing algorithm.
-# bcrypt is a strong and recommended choice.
-# "auto" will use the default scheme (bcrypt) for hashing and automatically
-# identify hashes of all supported schemes for verification.
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerifyMismatchError
+
+from app.core.config import settings
+
+# Argon2id replaces the old passlib CryptContext: it is memory-hard, its
+# cost parameters are explicit and tunable, and calling argon2-cffi directly
+# skips passlib's per-call scheme discovery and handler-lookup overhead.
+# Costs come from Settings so each deployment can calibrate hash latency
+# against its hardware; parallelism lets a single hash use multiple lanes.
+_ph = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM,
+)
+
+# A hash of a sentinel value that no real password can ever match.
+# Verifying against it when a user is missing or inactive makes every
+# authentication attempt cost exactly one hash operation, so response
+# timing no longer reveals whether a username exists.
+_DUMMY_HASH = _ph.hash("!invalid!")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """I need a function to verify a plain password against a stored hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    """I need a function to verify a plain password against a stored hash.
+
+    Primarily argon2id; hashes minted before the argon2 migration are
+    verified with the bcrypt backend directly so existing accounts keep
+    working (callers upgrade them via password_needs_rehash on success).
+    """
+    try:
+        return _ph.verify(hashed_password, plain_password)
+    except VerifyMismatchError:
+        return False
+    except InvalidHashError:
+        # Legacy bcrypt hash from the passlib era.
+        try:
+            return bcrypt.checkpw(
+                plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+            )
+        except ValueError:
+            return False
+
+def burn_password_check(plain_password: str) -> None:
+    """Spend one hash verification against the dummy hash and discard it.
+
+    Called on login paths where no (active) user was found, so that failed
+    lookups take the same time as real password checks.
+    """
+    try:
+        _ph.verify(_DUMMY_HASH, plain_password)
+    except VerifyMismatchError:
+        pass
 
 def get_password_hash(password: str) -> str:
     """I need a function to hash a plain password."""
-    return pwd_context.hash(password) 
\ No newline at end of file
+    return _ph.hash(password)
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True when a stored hash should be upgraded to the current argon2id
+    parameters — covers both stale argon2 parameters and legacy bcrypt
+    hashes. Check after a successful verification, then re-hash.
+    """
+    if not hashed_password.startswith("$argon2"):
+        return True
+    return _ph.check_needs_rehash(hashed_password)
+
+# --- Async wrappers ---
+# Password hashing holds a worker for tens of milliseconds per call. Running
+# it on FastAPI's shared thread pool lets a login burst starve every other
+# `def` endpoint, so hashing gets its own bounded pool sized to the cores.
+# Threads are enough for true parallelism here: argon2-cffi (like bcrypt)
+# does the work inside native C code that releases the GIL for the duration
+# of the call, so a thread pool scales across cores without the pickling
+# and IPC overhead a process pool would add per call.
+_HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Async verify_password, executed in the hashing thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _HASH_POOL, verify_password, plain_password, hashed_password
+    )
+
+async def aget_password_hash(password: str) -> str:
+    """Async get_password_hash, executed in the hashing thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _HASH_POOL, get_password_hash, password
+    )
+
+async def aburn_password_check(plain_password: str) -> None:
+    """Async burn_password_check, executed in the hashing thread pool."""
+    await asyncio.get_running_loop().run_in_executor(
+        _HASH_POOL, burn_password_check, plain_password
+    )
+
+def shutdown_hash_pool() -> None:
+    """Drain the hashing pool; call from the app's shutdown handler."""
+    _HASH_POOL.shutdown(wait=True)
@@ -1,6 +1,8 @@
+import uuid
+from datetime import datetime
+
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import MetaData
-from typing import Any
+from sqlalchemy import DateTime, MetaData, UUID as pgUUID
 
 # I should define a naming convention for constraints for Alembic migrations.
 # This helps keep migration files consistent and avoids unnamed constraints.
@@ -17,6 +19,10 @@ metadata = MetaData(naming_convention=convention)
 # I need to create the base class for my SQLAlchemy models.
 class Base(DeclarativeBase):
     metadata = metadata
-    # Optionally, define type annotation map or other base configurations
-    # type_annotation_map = {dict[str, Any]: JSON}
-    pass 
\ No newline at end of file
+    # Shared mapping from Python annotations to column types, so models can
+    # write `Mapped[uuid.UUID]` / `Mapped[datetime]` without repeating the
+    # dialect type on every column.
+    type_annotation_map = {
+        uuid.UUID: pgUUID(as_uuid=True),
+        datetime: DateTime(timezone=True),
+    }
@@ -0,0 +1,47 @@
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+# I need a small Redis layer for the auth hot paths. The first use case is a
+# negative cache for login lookups: credential-stuffing traffic is dominated
+# by usernames that don't exist, and each of those otherwise costs a Postgres
+# SELECT. Remembering "this username does not exist" for a short TTL turns
+# most of that load into a single Redis GET.
+
+_NEGATIVE_USER_PREFIX = "nx:user:"
+_NEGATIVE_USER_TTL_SECONDS = 60
+
+_redis: Optional[Redis] = None
+
+def get_redis() -> Redis:
+    """Lazily create one shared asyncio Redis client per process."""
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis
+
+async def is_username_known_missing(username: str) -> bool:
+    """True when we recently confirmed this username does not exist."""
+    try:
+        return await get_redis().get(_NEGATIVE_USER_PREFIX + username) is not None
+    except Exception:
+        # A cache outage must never take down login; fall through to the DB.
+        return False
+
+async def remember_username_missing(username: str) -> None:
+    """Record a failed username lookup for a short while."""
+    try:
+        await get_redis().setex(
+            _NEGATIVE_USER_PREFIX + username, _NEGATIVE_USER_TTL_SECONDS, "1"
+        )
+    except Exception:
+        pass
+
+async def forget_username_missing(username: str) -> None:
+    """Drop a negative entry, e.g. right after the username gets registered."""
+    try:
+        await get_redis().delete(_NEGATIVE_USER_PREFIX + username)
+    except Exception:
+        pass
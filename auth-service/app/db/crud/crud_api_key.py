@@ -0,0 +1,33 @@
+import hashlib
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.security import UserApiKey
+
+# API keys are random ~42-byte tokens (>200 bits of entropy), so unlike user
+# passwords they don't need a deliberately slow hash: SHA-256 is enough, and
+# hashlib dispatches to the CPU's SHA extensions via OpenSSL, making a
+# verification effectively free compared to a bcrypt/argon2 call.
+
+def hash_api_key(full_key: str) -> str:
+    """Hex SHA-256 fingerprint of a full API key, as stored in hashed_key."""
+    return hashlib.sha256(full_key.encode()).hexdigest()
+
+async def verify_api_key(db: AsyncSession, full_key: str) -> Optional[UserApiKey]:
+    """Resolve a presented API key to its active UserApiKey row, or None.
+
+    The stored prefix is the first 8 characters of the key (e.g. "dsk_xxxx"
+    from generate_key_components), so the lookup is a single indexed
+    equality on (prefix, hashed_key).
+    """
+    prefix = full_key[:8]
+    result = await db.execute(
+        select(UserApiKey).where(
+            UserApiKey.prefix == prefix,
+            UserApiKey.hashed_key == hash_api_key(full_key),
+            UserApiKey.is_active.is_(True),
+        )
+    )
+    return result.scalar_one_or_none()
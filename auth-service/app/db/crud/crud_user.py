@@ -1,60 +1,260 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, insert, lambda_stmt, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload, selectinload
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from typing import Optional
 import uuid
 
+from app.db import cache
 from app.db.models.user import User
+from app.db.models.profile import UserProfile
+from app.db.models.rbac import Role
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password # I need the hashing and verification functions
+from app.core.security import ( # I need the hashing and verification functions
+    password_needs_rehash,
+    aget_password_hash,
+    averify_password,
+    aburn_password_check,
+)
+
+# === Exceptions ===
+
+class UserAlreadyExists(Exception):
+    """Raised when an INSERT trips one of the unique constraints on users.
+
+    `field` tells the caller which column collided ("username" or "email"),
+    so the API layer can build a precise 409 response.
+    """
+    def __init__(self, field: str):
+        self.field = field
+        super().__init__(f"A user with this {field} already exists.")
 
 # === Get Operations ===
 
-def get_user(db: Session, user_id: uuid.UUID) -> Optional[User]:
-    """I need a function to get a single user by their ID."""
-    return db.query(User).filter(User.id == user_id).first()
+# The hot lookup statements are wrapped in lambda_stmt so SQL construction
+# and compilation happen once per process instead of on every call; only the
+# bound parameter values change between executions.
+
+_USER_BY_EMAIL_STMT = lambda_stmt(
+    lambda: select(User).where(User.email == bindparam("email"))
+)
 
-def get_user_by_email(db: Session, email: str) -> Optional[User]:
+_USER_BY_USERNAME_STMT = lambda_stmt(
+    lambda: select(User)
+    .options(
+        # created_at/updated_at ride along because the login response model
+        # (user_schemas.User) serializes them; leaving them deferred would
+        # trigger an implicit IO-in-serialization load on the AsyncSession.
+        load_only(
+            User.id,
+            User.username,
+            User.email,
+            User.hashed_password,
+            User.is_active,
+            User.created_at,
+            User.updated_at,
+        ),
+        raiseload(User.roles),
+        raiseload(User.profile),
+        raiseload(User.api_keys),
+    )
+    .where(User.username == bindparam("username"))
+)
+
+_USER_BY_USERNAME_WITH_ROLES_STMT = lambda_stmt(
+    lambda: select(User)
+    .options(selectinload(User.roles).selectinload(Role.permissions))
+    .where(User.username == bindparam("username"))
+)
+
+async def get_user(db: AsyncSession, user_id: uuid.UUID) -> Optional[User]:
+    """I need a function to get a single user by their ID.
+
+    Session.get hits the identity map first, so within a request this can
+    resolve without emitting SQL at all.
+    """
+    return await db.get(User, user_id)
+
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     """I need a function to get a single user by their email address."""
-    return db.query(User).filter(User.email == email).first()
+    result = await db.execute(_USER_BY_EMAIL_STMT, {"email": email})
+    return result.scalar_one_or_none()
+
+async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User]:
+    """I need a function to get a single user by their username.
+
+    This is the authentication hot path: it loads only the columns the
+    login flow touches and refuses to lazy-load any relationship, so a
+    username lookup stays a single SELECT instead of fanning out into the
+    selectin loads for roles/profile. Use get_user_by_username_with_roles
+    when the caller actually serializes the full user.
+    """
+    result = await db.execute(_USER_BY_USERNAME_STMT, {"username": username})
+    return result.scalar_one_or_none()
+
+async def get_user_by_username_with_roles(db: AsyncSession, username: str) -> Optional[User]:
+    """Get a user with roles and their permissions eagerly loaded.
+
+    For endpoints that serialize the full user: one extra SELECT per
+    relationship level via selectin, no per-row N+1.
+    """
+    result = await db.execute(_USER_BY_USERNAME_WITH_ROLES_STMT, {"username": username})
+    return result.scalar_one_or_none()
+
+_USERNAME_OR_EMAIL_STMT = lambda_stmt(
+    lambda: select(User.id, User.username, User.email)
+    .where(
+        or_(
+            User.username == bindparam("username"),
+            User.email == bindparam("email"),
+        )
+    )
+    .limit(2)
+)
 
-def get_user_by_username(db: Session, username: str) -> Optional[User]:
-    """I need a function to get a single user by their username."""
-    return db.query(User).filter(User.username == username).first()
+async def get_taken_username_email(
+    db: AsyncSession,
+    *,
+    username: str,
+    email: str,
+    exclude_user_id: Optional[uuid.UUID] = None,
+) -> tuple[bool, bool]:
+    """Check both unique columns in one round-trip.
 
-def get_users(
-    db: Session, skip: int = 0, limit: int = 100
+    Returns (username_taken, email_taken). The OR query can match at most
+    two rows thanks to the unique constraints, so this replaces the pair
+    of SELECTs the registration path used to issue. exclude_user_id lets
+    profile updates ignore the caller's own row.
+    """
+    result = await db.execute(
+        _USERNAME_OR_EMAIL_STMT, {"username": username, "email": email}
+    )
+    username_taken = email_taken = False
+    for row in result:
+        if exclude_user_id is not None and row.id == exclude_user_id:
+            continue
+        if row.username == username:
+            username_taken = True
+        # email is CITEXT, so the DB matched case-insensitively; mirror that.
+        if row.email.lower() == email.lower():
+            email_taken = True
+    return username_taken, email_taken
+
+async def get_users(
+    db: AsyncSession, skip: int = 0, limit: int = 100
 ) -> list[User]:
     """I need a function to get a list of users, with pagination (skip, limit)."""
-    return db.query(User).offset(skip).limit(limit).all()
+    result = await db.execute(select(User).offset(skip).limit(limit))
+    return list(result.scalars().all())
+
+# Listings never show hashed_password, so don't ship it over the wire or
+# build full ORM instances just to throw most of each row away.
+_MAX_USER_PAGE = 500
+
+async def get_users_profile(db: AsyncSession, skip: int = 0, limit: int = 100):
+    """Projected user listing: only the columns the profile view renders.
+
+    Returns plain Row objects (no ORM identity-map bookkeeping); limit is
+    capped at _MAX_USER_PAGE to keep a bad client from forcing an
+    unbounded scan.
+    """
+    limit = min(limit, _MAX_USER_PAGE)
+    result = await db.execute(
+        select(
+            User.id,
+            User.username,
+            User.email,
+            User.is_active,
+            User.created_at,
+            User.updated_at,
+        )
+        .offset(skip)
+        .limit(limit)
+    )
+    return result.all()
 
 # === Create Operation ===
 
-def create_user(db: Session, *, user_in: UserCreate) -> User:
+async def create_user(db: AsyncSession, *, user_in: UserCreate) -> User:
     """I need a function to create a new user in the database."""
-    # I must hash the password before storing it.
-    hashed_password = get_password_hash(user_in.password)
-
-    # I should create the SQLAlchemy model instance.
-    # Note: Pydantic's model_dump (or dict) excludes unset fields by default.
-    # We need all fields from UserCreate except the plain password.
-    db_user = User(
-        email=user_in.email,
-        username=user_in.username,
-        hashed_password=hashed_password,
-        role=user_in.role, # Role comes from UserCreate schema
-        is_active=True # Default to active on creation
+    # I must hash the password before storing it (in the hashing pool, so
+    # the event loop is never blocked).
+    hashed_password = await aget_password_hash(user_in.password)
+
+    # A single INSERT ... RETURNING populates the mapped instance with the
+    # database-generated values (ID, created_at), so no follow-up SELECT
+    # via refresh() is needed.
+    result = await db.execute(
+        insert(User)
+        .values(
+            email=user_in.email,
+            username=user_in.username,
+            hashed_password=hashed_password,
+            is_active=True, # Default to active on creation
+        )
+        .returning(User)
     )
+    db_user = result.scalars().one()
 
-    # I need to add the new user object to the session and commit.
-    db.add(db_user)
-    db.commit()
-    # I should refresh the object to get database-generated values (like ID, created_at).
-    db.refresh(db_user)
+    # The default profile row rides in the same transaction: one commit
+    # covers the whole signup instead of a second INSERT + commit later.
+    db.add(UserProfile(user_id=db_user.id))
+    await db.commit()
+    # The username exists now; make sure no stale negative entry lingers.
+    await cache.forget_username_missing(db_user.username)
     return db_user
 
+async def create_user_if_absent(db: AsyncSession, *, user_in: UserCreate) -> User:
+    """Create a new user in a single round-trip using INSERT ... ON CONFLICT.
+
+    Unlike create_user, this does not need the caller to probe for existing
+    username/email first (two extra SELECTs that race with concurrent writers
+    anyway). The database's own unique constraints arbitrate instead:
+    - a username collision is swallowed by ON CONFLICT DO NOTHING, which we
+      detect by the absence of a RETURNING row;
+    - an email collision surfaces as an IntegrityError, whose constraint name
+      tells us which column tripped.
+    Raises UserAlreadyExists("username"|"email") on conflict.
+    """
+    hashed_password = await aget_password_hash(user_in.password)
+
+    stmt = (
+        pg_insert(User)
+        .values(
+            email=user_in.email,
+            username=user_in.username,
+            hashed_password=hashed_password,
+            is_active=True,
+        )
+        .on_conflict_do_nothing(index_elements=["username"])
+        .returning(User)
+    )
+
+    try:
+        result = await db.execute(stmt)
+        created = result.scalars().first()
+        if created is not None:
+            # Default profile row in the same transaction as the user.
+            db.add(UserProfile(user_id=created.id))
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        # The driver exposes the violated constraint via the diagnostics area.
+        constraint = getattr(getattr(exc.orig, "diag", None), "constraint_name", None) or ""
+        raise UserAlreadyExists("email" if "email" in constraint else "username") from exc
+
+    if created is None:
+        # ON CONFLICT DO NOTHING ate a duplicate username without erroring.
+        raise UserAlreadyExists("username")
+    # The username exists now; make sure no stale negative entry lingers.
+    await cache.forget_username_missing(created.username)
+    return created
+
 # === Update Operation ===
 
-def update_user(
-    db: Session, *, db_user: User, user_in: UserUpdate
+async def update_user(
+    db: AsyncSession, *, db_user: User, user_in: UserUpdate
 ) -> User:
     """I need a function to update an existing user."""
     # I should get the update data from the input schema.
@@ -63,7 +263,7 @@ def update_user(
 
     # If a new password was provided, I need to hash it.
     if update_data.get("password"):
-        hashed_password = get_password_hash(update_data["password"])
+        hashed_password = await aget_password_hash(update_data["password"])
         update_data["hashed_password"] = hashed_password
         del update_data["password"] # Don't store the plain password field
 
@@ -73,37 +273,54 @@ def update_user(
 
     # I should add the updated object to the session and commit.
     db.add(db_user)
-    db.commit()
+    await db.commit()
     # Refresh to get any updated fields from the DB (like updated_at).
-    db.refresh(db_user)
+    await db.refresh(db_user)
     return db_user
 
 # === Delete Operation ===
 
-def delete_user(db: Session, *, user_id: uuid.UUID) -> Optional[User]:
+async def delete_user(db: AsyncSession, *, user_id: uuid.UUID) -> Optional[User]:
     """I need a function to delete a user by their ID."""
-    db_user = db.query(User).filter(User.id == user_id).first()
+    db_user = await db.get(User, user_id)
     if db_user:
-        db.delete(db_user)
-        db.commit()
+        await db.delete(db_user)
+        await db.commit()
     return db_user
 
 # === Authentication Helper (Placeholder) ===
 # While full authentication logic belongs in an API layer or service,
 # a CRUD helper might exist.
 
-def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
+async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[User]:
     """
     I need a function to check if a user exists and the password is correct.
     Note: This mixes concerns slightly, authentication logic is often separate.
     Returns the user object if authentication succeeds, otherwise None.
+
+    Every path performs exactly one password-hash verification (run in the
+    hashing thread pool): when the user is missing or inactive we burn a
+    check against a dummy hash instead of returning early, so timing doesn't
+    leak which usernames exist and /login latency stays flat.
     """
-    user = get_user_by_username(db, username=username)
-    if not user:
+    # Negative cache first: during credential-stuffing floods most attempts
+    # are for usernames that don't exist, and this skips the Postgres SELECT
+    # for them entirely. The dummy verify below still runs, so the timing
+    # profile is unchanged.
+    if await cache.is_username_known_missing(username):
+        await aburn_password_check(password)
         return None
-    if not user.is_active:
-        # Maybe return a specific error or flag for inactive users?
+    user = await get_user_by_username(db, username=username)
+    if user is None:
+        await cache.remember_username_missing(username)
+    if user is None or not user.is_active:
+        await aburn_password_check(password)
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await averify_password(password, user.hashed_password):
         return None
-    return user
\ No newline at end of file
+    # Lazy migration: upgrade legacy bcrypt (or stale argon2) hashes while
+    # we still hold the plaintext from a successful login.
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await aget_password_hash(password)
+        await db.commit()
+    return user
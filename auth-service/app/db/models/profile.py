@@ -1,22 +1,25 @@
 import uuid
-from sqlalchemy import Column, String, Text, ForeignKey, DateTime, func, UUID as pgUUID
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, Text, ForeignKey, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base_class import Base
 
 class UserProfile(Base):
     __tablename__ = "user_profiles"
-    id = Column(pgUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(pgUUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), unique=True, nullable=False, index=True)
-    
-    first_name = Column(String(100), nullable=True)
-    last_name = Column(String(100), nullable=True)
-    bio = Column(Text, nullable=True)
-    avatar_url = Column(String(255), nullable=True)
-    
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('users.id', ondelete='CASCADE'), unique=True, index=True)
+
+    first_name: Mapped[Optional[str]] = mapped_column(String(100))
+    last_name: Mapped[Optional[str]] = mapped_column(String(100))
+    bio: Mapped[Optional[str]] = mapped_column(Text)
+    avatar_url: Mapped[Optional[str]] = mapped_column(String(255))
+
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(onupdate=func.now(), server_default=func.now())
 
-    user = relationship("User", back_populates="profile")
+    user: Mapped["User"] = relationship(back_populates="profile")
 
     def __repr__(self):
-        return f"<UserProfile(user_id={self.user_id}, name='{self.first_name} {self.last_name}')>" 
\ No newline at end of file
+        return f"<UserProfile(user_id={self.user_id}, name='{self.first_name} {self.last_name}')>"
@@ -1,6 +1,9 @@
 import uuid
-from sqlalchemy import Column, String, ForeignKey, DateTime, Table, func, UUID as pgUUID
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import Column, String, ForeignKey, Table, func, UUID as pgUUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base_class import Base
 
 # Association table for User and Role (many-to-many)
@@ -17,26 +20,26 @@ role_permissions_table = Table('role_permissions', Base.metadata,
 
 class Role(Base):
     __tablename__ = "roles"
-    id = Column(pgUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String(50), unique=True, index=True, nullable=False) # e.g., ROLE_USER, ROLE_ADMIN, ROLE_PROVIDER
-    description = Column(String(255), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    name: Mapped[str] = mapped_column(String(50), unique=True, index=True) # e.g., ROLE_USER, ROLE_ADMIN, ROLE_PROVIDER
+    description: Mapped[Optional[str]] = mapped_column(String(255))
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(onupdate=func.now(), server_default=func.now())
 
-    permissions = relationship("Permission", secondary=role_permissions_table, back_populates="roles", lazy="selectin")
-    users = relationship("User", secondary=user_roles_table, back_populates="roles", lazy="selectin")
+    permissions: Mapped[List["Permission"]] = relationship(secondary=role_permissions_table, back_populates="roles", lazy="selectin")
+    users: Mapped[List["User"]] = relationship(secondary=user_roles_table, back_populates="roles", lazy="raise")
 
     def __repr__(self):
         return f"<Role(id={self.id}, name='{self.name}')>"
 
 class Permission(Base):
     __tablename__ = "permissions"
-    id = Column(pgUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String(100), unique=True, index=True, nullable=False) # e.g., users:create, users:read_all, providers:manage_own
-    description = Column(String(255), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    name: Mapped[str] = mapped_column(String(100), unique=True, index=True) # e.g., users:create, users:read_all, providers:manage_own
+    description: Mapped[Optional[str]] = mapped_column(String(255))
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=func.now())
 
-    roles = relationship("Role", secondary=role_permissions_table, back_populates="permissions", lazy="selectin")
+    roles: Mapped[List["Role"]] = relationship(secondary=role_permissions_table, back_populates="permissions", lazy="raise")
 
     def __repr__(self):
-        return f"<Permission(id={self.id}, name='{self.name}')>" 
\ No newline at end of file
+        return f"<Permission(id={self.id}, name='{self.name}')>"
@@ -1,27 +1,33 @@
 import uuid
-from sqlalchemy import Column, String, ForeignKey, DateTime, func, Text, Boolean, Index, UUID as pgUUID
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, ForeignKey, func, Text, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base_class import Base
 import secrets
 
 class UserApiKey(Base):
     __tablename__ = "user_api_keys"
-    id = Column(pgUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(pgUUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
-    key_name = Column(String(100), nullable=False)
-    prefix = Column(String(8), unique=True, nullable=False)
-    hashed_key = Column(String(255), nullable=False, unique=True)
-    scopes = Column(Text, nullable=True)
-    expires_at = Column(DateTime(timezone=True), nullable=True)
-    last_used_at = Column(DateTime(timezone=True), nullable=True)
-    is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
-
-    user = relationship("User", back_populates="api_keys")
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('users.id', ondelete='CASCADE'), index=True)
+    key_name: Mapped[str] = mapped_column(String(100))
+    prefix: Mapped[str] = mapped_column(String(8), unique=True)
+    # SHA-256 hex fingerprint of the full key (64 chars). The key itself is a
+    # high-entropy random token, so a fast hash is cryptographically
+    # sufficient here - no need to burn bcrypt-grade CPU per verification.
+    hashed_key: Mapped[str] = mapped_column(String(64), unique=True)
+    scopes: Mapped[Optional[str]] = mapped_column(Text)
+    expires_at: Mapped[Optional[datetime]]
+    last_used_at: Mapped[Optional[datetime]]
+    is_active: Mapped[bool] = mapped_column(default=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(onupdate=func.now(), server_default=func.now())
+
+    user: Mapped["User"] = relationship(back_populates="api_keys")
 
     __table_args__ = (Index('ix_user_api_keys_user_id_key_name', 'user_id', 'key_name', unique=True),)
-    
+
     def __repr__(self):
         return f"<UserApiKey(user_id={self.user_id}, name='{self.key_name}', prefix='{self.prefix}')>"
 
@@ -36,15 +42,15 @@ class UserApiKey(Base):
 
 class LoginHistory(Base):
     __tablename__ = "login_history"
-    id = Column(pgUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(pgUUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
-    login_timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    ip_address = Column(String(45), nullable=True)
-    user_agent = Column(String(512), nullable=True)
-    login_successful = Column(Boolean, nullable=False)
-    failure_reason = Column(String(255), nullable=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('users.id', ondelete='CASCADE'), index=True)
+    login_timestamp: Mapped[datetime] = mapped_column(server_default=func.now())
+    ip_address: Mapped[Optional[str]] = mapped_column(String(45))
+    user_agent: Mapped[Optional[str]] = mapped_column(String(512))
+    login_successful: Mapped[bool]
+    failure_reason: Mapped[Optional[str]] = mapped_column(String(255))
 
-    user = relationship("User")
+    user: Mapped["User"] = relationship()
 
     def __repr__(self):
-        return f"<LoginHistory(user_id={self.user_id}, timestamp='{self.login_timestamp}', success={self.login_successful})>" 
\ No newline at end of file
+        return f"<LoginHistory(user_id={self.user_id}, timestamp='{self.login_timestamp}', success={self.login_successful})>"
@@ -1,6 +1,10 @@
 import uuid
-from sqlalchemy import Column, String, Boolean, DateTime, func, UUID as pgUUID
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import String, func
+from sqlalchemy.dialects.postgresql import CITEXT
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base_class import Base
 from .rbac import user_roles_table # Import the association table
 
@@ -9,26 +13,37 @@ class User(Base):
     __tablename__ = "users"
 
     # I need to define the columns for the users table.
-    id = Column(pgUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    email = Column(String(255), unique=True, index=True, nullable=False)
-    username = Column(String(100), unique=True, index=True, nullable=False)
-    hashed_password = Column(String(255), nullable=False)
-    is_active = Column(Boolean(), default=True, nullable=False)
-    is_verified = Column(Boolean(), default=False, nullable=False) # New: for email verification
+    # Typed Mapped[...] annotations drive nullability (Optional => nullable)
+    # and pick up column types from Base.type_annotation_map.
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    # CITEXT so 'Foo@x.com' and 'foo@x.com' are the same account and the
+    # unique index is hit without LOWER() wrapping on either side.
+    email: Mapped[str] = mapped_column(CITEXT(), unique=True, index=True)
+    # Both unique btree indexes below are load-bearing for the auth path:
+    # every login / token check resolves through them, and the fused
+    # username-OR-email registration probe is served by a bitmap OR over
+    # the two — no composite index needed.
+    username: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    hashed_password: Mapped[str] = mapped_column(String(255))
+    is_active: Mapped[bool] = mapped_column(default=True)
+    is_verified: Mapped[bool] = mapped_column(default=False) # New: for email verification
     # 'role' string column is removed. Roles are now managed via user_roles_table.
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now(), nullable=False)
-    last_login_at = Column(DateTime(timezone=True), nullable=True) # New
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(onupdate=func.now(), server_default=func.now())
+    last_login_at: Mapped[Optional[datetime]] # New
 
     # Relationships
-    profile = relationship("UserProfile", back_populates="user", uselist=False, cascade="all, delete-orphan", lazy="selectin")
-    roles = relationship("Role", secondary=user_roles_table, back_populates="users", lazy="selectin")
-    api_keys = relationship("UserApiKey", back_populates="user", cascade="all, delete-orphan", lazy="noload")
+    # lazy="raise" so an accidental lazy load fails loudly; callers opt in
+    # to eager loading explicitly (e.g. selectinload in the crud helpers)
+    # instead of every User fetch paying for selectin queries it won't use.
+    profile: Mapped[Optional["UserProfile"]] = relationship(back_populates="user", cascade="all, delete-orphan", lazy="raise")
+    roles: Mapped[List["Role"]] = relationship(secondary=user_roles_table, back_populates="users", lazy="raise")
+    api_keys: Mapped[List["UserApiKey"]] = relationship(back_populates="user", cascade="all, delete-orphan", lazy="noload")
     # login_history can be queried separately if needed, not always loaded with user.
 
     # Financial fields like wallet_address, balance_dgpu, etc., are REMOVED.
 
     def __repr__(self):
         # I should add a representation for easier debugging.
-        return f"<User(id={self.id}, email='{self.email}', username='{self.username}')>" 
\ No newline at end of file
+        return f"<User(id={self.id}, email='{self.email}', username='{self.username}')>"
@@ -1,25 +1,58 @@
+from asyncio import current_task
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import (
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings # I need the DATABASE_URL from settings
 
-# I need to create the SQLAlchemy engine.
-# connect_args is useful for SQLite, but for PostgreSQL it's usually empty.
-engine = create_engine(
+# I need to create the async SQLAlchemy engine (asyncpg driver).
+# pool_timeout fails fast instead of hanging a request when the pool is
+# drained; overflow absorbs bursts; pool_recycle avoids stale connections
+# behind aggressive LB/firewall idle timeouts; pre-ping validates before use.
+engine = create_async_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True # Checks connection validity before use
-    # connect_args={"check_same_thread": False} # Only needed for SQLite
+    pool_size=20,
+    max_overflow=40,
+    pool_timeout=2.0,
+    pool_recycle=3600,
+    pool_pre_ping=True,
+)
+
+# I need to create a configured async "Session" class.
+# expire_on_commit=False so committed objects stay usable for response
+# serialization without triggering implicit refresh queries.
+AsyncSessionLocal = async_sessionmaker(
+    engine, autoflush=False, expire_on_commit=False
 )
 
-# I need to create a configured "Session" class.
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Task-scoped session registry: each asyncio task (FastAPI runs one task
+# per request) gets its own session, and repeated lookups within the task
+# reuse it instead of constructing a fresh Session with a full option copy.
+AsyncScopedSession = async_scoped_session(AsyncSessionLocal, scopefunc=current_task)
 
-# --- Dependency for FastAPI --- 
+# --- Dependency for FastAPI ---
 # I should create a dependency function to get a DB session per request.
-# This ensures the session is always closed after the request.
-def get_db():
-    db = SessionLocal()
+# remove() closes the session and drops it from the registry, so cleanup
+# still happens once the request's task finishes.
+async def get_db():
     try:
-        yield db
+        yield AsyncScopedSession()
     finally:
-        db.close() 
\ No newline at end of file
+        await AsyncScopedSession.remove()
+
+# --- Legacy sync access ---
+# The standalone scripts and services (init_db.py, create_tables.py,
+# app/main.py) and Alembic still run synchronously over psycopg2; they
+# share the same URL with only the driver swapped so there is a single
+# source of truth for connection details.
+sync_engine = create_engine(
+    settings.DATABASE_URL.replace("+asyncpg", "+psycopg2"),
+    pool_pre_ping=True,
+)
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
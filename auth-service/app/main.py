@@ -1,33 +1,45 @@
+"""Canonical standalone auth entrypoint (uvicorn app.main:app, port 8090).
+
+This is the only main.py; earlier working copies with conflicting startup
+logic are gone. Login goes through crud_user.authenticate_user, which is a
+single SELECT plus one hash verification (a dummy verification when the
+user is missing or inactive, so timing stays flat).
+"""
 import asyncio
+import hashlib
+import threading
+import time
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 
+from cachetools import TTLCache
+
 import uvicorn
 from fastapi import FastAPI, HTTPException, Depends, status, Security
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from passlib.context import CryptContext
+from sqlalchemy import func, text
+from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError, jwt
 import secrets
 
-from app.core.config import Settings
+from app.core.config import get_settings
 from app.db.session import get_db
 from app.db.models.user import User
 from app.db.crud.crud_user import (
-    create_user, 
-    get_user_by_email, 
-    get_user_by_username, 
+    create_user,
+    get_user_by_username,
+    get_taken_username_email,
     authenticate_user,
     get_user,
-    get_users
+    get_users_profile
 )
 from app.schemas.user import UserCreate, User as UserSchema, UserUpdate
-from app.core.security import verify_password, get_password_hash
+from app.core.security import averify_password, aget_password_hash, shutdown_hash_pool
 
-# Initialize settings
-settings = Settings()
+# Initialize settings (cached; shares the instance with the rest of the app)
+settings = get_settings()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -38,26 +50,20 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
-# CORS configuration
+# CORS configuration. One regex (compiled once by Starlette) replaces the
+# eight-entry origin list the middleware would otherwise scan linearly on
+# every preflight/cross-origin request. Covers the frontend (3000/3001),
+# API gateway (8080) and test server (9999) on localhost and 127.0.0.1.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000", 
-        "http://localhost:3001",  # Frontend Next.js
-        "http://localhost:8080",  # API Gateway
-        "http://localhost:9999",  # Test server
-        "http://127.0.0.1:3000",
-        "http://127.0.0.1:3001",
-        "http://127.0.0.1:8080",
-        "http://127.0.0.1:9999",
-    ],
+    allow_origin_regex=r"^http://(localhost|127\.0\.0\.1):(3000|3001|8080|9999)$",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing lives in app.core.security (argon2id, Settings-tuned
+# costs); the old module-level CryptContext here was unused.
 
 # JWT Security
 security = HTTPBearer()
@@ -96,14 +102,17 @@ class AuthResponse(BaseModel):
     token: str
     refresh_token: str
     expires_at: datetime
-    user_id: str
+    # UUID stays a UUID until response serialization: pydantic renders it
+    # as a string in JSON mode anyway, so Python-side str() per response
+    # was a redundant allocation.
+    user_id: uuid.UUID
     username: str
     email: str
     role: str
     permissions: List[str] = []
 
 class UserProfile(BaseModel):
-    id: str
+    id: uuid.UUID
     username: str
     email: str
     role: str
@@ -123,27 +132,90 @@ class PasswordResetConfirm(BaseModel):
     new_password: str
 
 # JWT Functions
+# Signing material resolved once at import: pydantic-settings attribute
+# access goes through descriptors, and jose re-derives key material from
+# whatever it is handed per call — neither belongs on the per-token path.
+# (Under HS256 this is modest; it would matter far more if RS256's PEM
+# parsing ever entered the picture.)
+_SECRET = settings.SECRET_KEY
+_ALG = settings.ALGORITHM
+_ALGS = [_ALG]
+
+# Clients reuse the same bearer token for its whole lifetime, so re-running
+# HMAC verification on every request is wasted CPU. Successfully decoded
+# payloads are cached (bounded, TTL) keyed by a blake2b digest of the token
+# so the raw token isn't held in memory; entries are ignored once the
+# token's own exp passes, and failed decodes are never cached.
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+def _decode_token_cached(token: str) -> dict:
+    """jwt.decode with a bounded TTL cache; raises JWTError like jwt.decode."""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+
+    with _TOKEN_CACHE_LOCK:
+        payload = _TOKEN_CACHE.get(key)
+    if payload is not None and payload.get("exp", 0) > now:
+        return payload
+
+    payload = jwt.decode(token, _SECRET, algorithms=_ALGS)
+    if payload.get("exp", 0) > now:
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE[key] = payload
+    return payload
+
+# Token expiry math works on numeric epoch seconds: the JWT spec defines
+# exp/iat as NumericDate anyway, so passing ints straight through spares a
+# datetime allocation plus python-jose's internal datetime->epoch
+# conversion on every token issued. Only the response schema gets a
+# datetime, built once at the end.
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(hours=24)
-    
-    to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt, expire
+    now = int(time.time())
+    exp = now + int(expires_delta.total_seconds()) if expires_delta else now + 86400
+    to_encode.update({"exp": exp, "iat": now, "type": "access"})
+    encoded_jwt = jwt.encode(to_encode, _SECRET, algorithm=_ALG)
+    return encoded_jwt, datetime.fromtimestamp(exp, tz=timezone.utc)
 
 def create_refresh_token(data: dict):
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=30)
-    to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt, expire
+    now = int(time.time())
+    exp = now + 30 * 86400
+    to_encode.update({"exp": exp, "iat": now, "type": "refresh"})
+    encoded_jwt = jwt.encode(to_encode, _SECRET, algorithm=_ALG)
+    return encoded_jwt, datetime.fromtimestamp(exp, tz=timezone.utc)
+
+# Role -> permissions is static, so build it once at import time instead of
+# allocating fresh lists on every auth response. Tuples keep the mapping
+# effectively immutable; handlers copy to a list only because the response
+# schema declares List[str].
+_ROLE_PERMS = {
+    "user": ("user:read", "wallet:read", "job:submit"),
+    "admin": ("admin:all",),
+}
+
+def _build_auth_response(user: User, access_token: str, refresh_token: str,
+                         access_expires: datetime) -> AuthResponse:
+    """Assemble the AuthResponse shared by register, login and refresh.
+
+    model_construct skips field validation; every value here comes from a
+    trusted DB row or a token we just signed, so there is nothing to coerce.
+    """
+    return AuthResponse.model_construct(
+        token=access_token,
+        refresh_token=refresh_token,
+        expires_at=access_expires,
+        user_id=user.id,
+        username=user.username,
+        email=user.email,
+        role=user.role,
+        permissions=list(_ROLE_PERMS.get(user.role, ()))
+    )
 
 def verify_token(token: str) -> TokenData:
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = _decode_token_cached(token)
         username: str = payload.get("sub")
         user_id: str = payload.get("user_id")
         email: str = payload.get("email")
@@ -170,14 +242,19 @@ def verify_token(token: str) -> TokenData:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+# NOTE: the whole auth dependency chain (get_db -> get_current_user ->
+# get_current_active_user) must stay `async def`. FastAPI runs plain `def`
+# dependencies in the anyio threadpool, which adds a per-request hop on
+# every protected route; verify_token is CPU-only (cached decode, no I/O)
+# so it is safe to call inline here.
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Security(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     token = credentials.credentials
     token_data = verify_token(token)
-    
-    user = get_user_by_username(db, username=token_data.username)
+
+    user = await get_user_by_username(db, username=token_data.username)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -200,19 +277,19 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
 
 # Authentication Routes
 @app.post("/api/v1/auth/register", response_model=AuthResponse)
-async def register(user_data: RegisterRequest, db: Session = Depends(get_db)):
+async def register(user_data: RegisterRequest, db: AsyncSession = Depends(get_db)):
     """Register a new user account"""
-    
-    # Check if user already exists
-    existing_user_email = get_user_by_email(db, email=user_data.email)
-    if existing_user_email:
+
+    # Check both unique columns in one round-trip instead of two SELECTs
+    username_taken, email_taken = await get_taken_username_email(
+        db, username=user_data.username, email=user_data.email
+    )
+    if email_taken:
         raise HTTPException(
             status_code=400,
             detail="Email already registered"
         )
-    
-    existing_user_username = get_user_by_username(db, username=user_data.username)
-    if existing_user_username:
+    if username_taken:
         raise HTTPException(
             status_code=400,
             detail="Username already taken"
@@ -234,7 +311,7 @@ async def register(user_data: RegisterRequest, db: Session = Depends(get_db)):
     )
     
     try:
-        user = create_user(db, user_in=user_create)
+        user = await create_user(db, user_in=user_create)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -258,23 +335,14 @@ async def register(user_data: RegisterRequest, db: Session = Depends(get_db)):
         }
     )
     
-    return AuthResponse(
-        token=access_token,
-        refresh_token=refresh_token,
-        expires_at=access_expires,
-        user_id=str(user.id),
-        username=user.username,
-        email=user.email,
-        role=user.role,
-        permissions=["user:read", "wallet:read", "job:submit"] if user.role == "user" else ["admin:all"]
-    )
+    return _build_auth_response(user, access_token, refresh_token, access_expires)
 
 @app.post("/api/v1/auth/login", response_model=AuthResponse)
-async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
+async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_db)):
     """Authenticate user and return access tokens"""
-    
+
     # Authenticate user
-    user = authenticate_user(db, login_data.username, login_data.password)
+    user = await authenticate_user(db, login_data.username, login_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -305,23 +373,14 @@ async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
         }
     )
     
-    return AuthResponse(
-        token=access_token,
-        refresh_token=refresh_token,
-        expires_at=access_expires,
-        user_id=str(user.id),
-        username=user.username,
-        email=user.email,
-        role=user.role,
-        permissions=["user:read", "wallet:read", "job:submit"] if user.role == "user" else ["admin:all"]
-    )
+    return _build_auth_response(user, access_token, refresh_token, access_expires)
 
 @app.post("/api/v1/auth/refresh", response_model=AuthResponse)
-async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
+async def refresh_token(refresh_token: str, db: AsyncSession = Depends(get_db)):
     """Refresh access token using refresh token"""
     
     try:
-        payload = jwt.decode(refresh_token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = _decode_token_cached(refresh_token)
         username: str = payload.get("sub")
         token_type: str = payload.get("type")
         
@@ -331,7 +390,7 @@ async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
                 detail="Invalid refresh token"
             )
         
-        user = get_user_by_username(db, username=username)
+        user = await get_user_by_username(db, username=username)
         if user is None or not user.is_active:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -348,16 +407,8 @@ async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
             }
         )
         
-        return AuthResponse(
-            token=access_token,
-            refresh_token=refresh_token,  # Keep the same refresh token
-            expires_at=access_expires,
-            user_id=str(user.id),
-            username=user.username,
-            email=user.email,
-            role=user.role,
-            permissions=["user:read", "wallet:read", "job:submit"] if user.role == "user" else ["admin:all"]
-        )
+        # Keep the same refresh token
+        return _build_auth_response(user, access_token, refresh_token, access_expires)
         
     except JWTError:
         raise HTTPException(
@@ -368,9 +419,10 @@ async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
 @app.get("/api/v1/auth/profile", response_model=UserProfile)
 async def get_user_profile(current_user: User = Depends(get_current_active_user)):
     """Get current user profile information"""
-    
-    return UserProfile(
-        id=str(current_user.id),
+
+    # Trusted DB row; skip re-validation on the way out.
+    return UserProfile.model_construct(
+        id=current_user.id,
         username=current_user.username,
         email=current_user.email,
         role=current_user.role,
@@ -383,23 +435,27 @@ async def get_user_profile(current_user: User = Depends(get_current_active_user)
 async def update_user_profile(
     user_update: UserUpdate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update current user profile"""
-    
-    # Check if email is being changed and if it's already taken
-    if user_update.email and user_update.email != current_user.email:
-        existing_user = get_user_by_email(db, email=user_update.email)
-        if existing_user and existing_user.id != current_user.id:
+
+    # Check whether the new username/email collide with another account;
+    # one fused query covers both columns, ignoring the caller's own row.
+    email_changing = bool(user_update.email and user_update.email != current_user.email)
+    username_changing = bool(user_update.username and user_update.username != current_user.username)
+    if email_changing or username_changing:
+        username_taken, email_taken = await get_taken_username_email(
+            db,
+            username=user_update.username if username_changing else current_user.username,
+            email=user_update.email if email_changing else current_user.email,
+            exclude_user_id=current_user.id,
+        )
+        if email_changing and email_taken:
             raise HTTPException(
                 status_code=400,
                 detail="Email already registered"
             )
-    
-    # Check if username is being changed and if it's already taken
-    if user_update.username and user_update.username != current_user.username:
-        existing_user = get_user_by_username(db, username=user_update.username)
-        if existing_user and existing_user.id != current_user.id:
+        if username_changing and username_taken:
             raise HTTPException(
                 status_code=400,
                 detail="Username already taken"
@@ -407,10 +463,10 @@ async def update_user_profile(
     
     try:
         from app.db.crud.crud_user import update_user
-        updated_user = update_user(db, db_user=current_user, user_in=user_update)
-        
-        return UserProfile(
-            id=str(updated_user.id),
+        updated_user = await update_user(db, db_user=current_user, user_in=user_update)
+
+        return UserProfile.model_construct(
+            id=updated_user.id,
             username=updated_user.username,
             email=updated_user.email,
             role=updated_user.role,
@@ -428,12 +484,13 @@ async def update_user_profile(
 async def change_password(
     password_data: PasswordChangeRequest,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Change user password"""
     
-    # Verify current password
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    # Verify current password (hashing runs on the dedicated pool so the
+    # event loop stays free to serve other requests)
+    if not await averify_password(password_data.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=400,
             detail="Current password is incorrect"
@@ -448,14 +505,16 @@ async def change_password(
     
     try:
         # Update password
-        current_user.hashed_password = get_password_hash(password_data.new_password)
-        current_user.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(current_user)
-        
+        current_user.hashed_password = await aget_password_hash(password_data.new_password)
+        # Let the database clock stamp the update; it is authoritative and
+        # saves a Python-side datetime allocation.
+        current_user.updated_at = func.now()
+        await db.commit()
+        await db.refresh(current_user)
+
         return {"message": "Password changed successfully"}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"Failed to change password: {str(e)}"
@@ -474,7 +533,7 @@ async def list_users(
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """List all users (admin only)"""
     
@@ -484,18 +543,21 @@ async def list_users(
             detail="Insufficient permissions"
         )
     
-    users = get_users(db, skip=skip, limit=limit)
+    # Projected query: no hashed_password over the wire, no ORM instance
+    # per row. model_construct per row keeps serialization cheap too, as
+    # /users builds N of these in a loop.
+    rows = await get_users_profile(db, skip=skip, limit=limit)
     return [
-        UserProfile(
-            id=str(user.id),
-            username=user.username,
-            email=user.email,
-            role=user.role,
-            is_active=user.is_active,
-            created_at=user.created_at,
-            updated_at=user.updated_at
+        UserProfile.model_construct(
+            id=row.id,
+            username=row.username,
+            email=row.email,
+            role=getattr(row, "role", "user"),
+            is_active=row.is_active,
+            created_at=row.created_at,
+            updated_at=row.updated_at
         )
-        for user in users
+        for row in rows
     ]
 
 # Health check
@@ -525,45 +587,73 @@ async def startup_event():
     """Initialize database and create default admin user"""
     try:
         from app.db.session import engine
-        from app.db.base_class import Base
-        
-        # Create tables
-        Base.metadata.create_all(bind=engine)
-        
-        # Create default admin user if it doesn't exist
-        db = next(get_db())
-        try:
-            admin_user = get_user_by_username(db, username="admin")
-            if not admin_user:
-                admin_create = UserCreate(
-                    username="admin",
-                    email="admin@dantegpu.com",
-                    password="admin123",
-                    role="admin"
-                )
-                create_user(db, user_in=admin_create)
-                print("✅ Default admin user created: admin / admin123")
-            
-            # Create demo user if it doesn't exist
-            demo_user = get_user_by_username(db, username="demo")
-            if not demo_user:
-                demo_create = UserCreate(
-                    username="demo",
-                    email="demo@dantegpu.com",
-                    password="demo12345",
-                    role="user"
+
+        # Schema is managed by Alembic (`alembic upgrade head` at deploy);
+        # running create_all here issued has_table probes for every model
+        # on every worker boot for no benefit.
+
+        # Warm the async pool so the first real requests don't pay the
+        # connection-establishment cost.
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+        # Seed default users only when explicitly asked (fresh
+        # environments); the advisory lock makes sure exactly one worker
+        # does the inserts even on a multi-worker boot.
+        if settings.SEED_DEFAULT_USERS:
+            # Session-level lock on its own connection: create_user commits
+            # mid-seed, which would release a transaction-scoped lock early.
+            async with engine.connect() as lock_conn:
+                await lock_conn.execute(
+                    text("SELECT pg_advisory_lock(hashtext('seed_users'))")
                 )
-                create_user(db, user_in=demo_create)
-                print("✅ Demo user created: demo / demo12345")
-                
-        finally:
-            db.close()
-            
+                try:
+                    await _seed_default_users()
+                finally:
+                    await lock_conn.execute(
+                        text("SELECT pg_advisory_unlock(hashtext('seed_users'))")
+                    )
+
         print("🚀 DanteGPU Authentication Service started successfully!")
-        
+
     except Exception as e:
         print(f"❌ Failed to initialize database: {e}")
 
+async def _seed_default_users():
+    """Insert the default admin/demo accounts if they are missing.
+
+    Runs under the seed_users advisory lock taken in startup_event.
+    """
+    from app.db.session import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        admin_user = await get_user_by_username(db, username="admin")
+        if not admin_user:
+            admin_create = UserCreate(
+                username="admin",
+                email="admin@dantegpu.com",
+                password="admin123",
+                role="admin"
+            )
+            await create_user(db, user_in=admin_create)
+            print("✅ Default admin user created: admin / admin123")
+
+        demo_user = await get_user_by_username(db, username="demo")
+        if not demo_user:
+            demo_create = UserCreate(
+                username="demo",
+                email="demo@dantegpu.com",
+                password="demo12345",
+                role="user"
+            )
+            await create_user(db, user_in=demo_create)
+            print("✅ Demo user created: demo / demo12345")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Drain the password-hashing pool before the process exits"""
+    shutdown_hash_pool()
+
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional
 from datetime import datetime
 import uuid
@@ -35,9 +35,11 @@ class UserInDBBase(UserBase):
     updated_at: datetime
 
     # I should configure Pydantic to work with ORM models.
-    model_config = {
-        "from_attributes": True # Renamed from orm_mode in Pydantic v2
-    }
+    # from_attributes lets pydantic-core read the SQLAlchemy instance's
+    # attributes directly (no dict conversion), and defer_build=False forces
+    # the validator/serializer core to be compiled at import time so the
+    # first request doesn't pay the schema-build cost.
+    model_config = ConfigDict(from_attributes=True, defer_build=False)
 
 # The final schema for returning user data via the API.
 class User(UserInDBBase):
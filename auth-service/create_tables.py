@@ -10,7 +10,7 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from app.db.session import engine
+    from app.db.session import sync_engine as engine
     from app.db.models import user
     from app.db.base_class import Base
     
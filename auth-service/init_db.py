@@ -1,50 +1,50 @@
 #!/usr/bin/env python3
-"""Initialize database with tables and default users."""
+"""Initialize database schema (via Alembic) and default users."""
 
-from app.db.session import engine, SessionLocal
-from app.db.base import Base
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.security import get_password_hash
+from app.db.session import SessionLocal
 from app.db.models.user import User
-from app.db.crud.crud_user import create_user
-from app.schemas.user import UserCreate
 
 def init_database():
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
-    print("Database tables created!")
-    
-    # Create default users
+    # Bring the schema to head through the migration chain instead of
+    # create_all: deterministic across workers and no pg_catalog probing
+    # for tables that already exist.
+    command.upgrade(Config(str(Path(__file__).parent / "alembic.ini")), "head")
+    print("Database schema migrated to head!")
+
+    # Seed default users in one idempotent statement: ON CONFLICT DO
+    # NOTHING replaces the old exception-driven "may already exist" flow
+    # and is race-free when several workers run this concurrently.
     db = SessionLocal()
     try:
-        # Create admin user
-        admin_data = UserCreate(
-            username='admin',
-            email='admin@dantegpu.com',
-            password='admin123',
-            role='admin'
+        db.execute(
+            pg_insert(User)
+            .values([
+                {
+                    "username": "admin",
+                    "email": "admin@dantegpu.com",
+                    "hashed_password": get_password_hash("admin123"),
+                },
+                {
+                    "username": "demo",
+                    "email": "demo@dantegpu.com",
+                    "hashed_password": get_password_hash("demo123456"),
+                },
+            ])
+            .on_conflict_do_nothing()
         )
-        try:
-            admin_user = create_user(db, user_in=admin_data)
-            print(f"Admin user created: {admin_user.username}")
-        except Exception as e:
-            print(f"Admin user may already exist: {e}")
-        
-        # Create demo user
-        demo_data = UserCreate(
-            username='demo',
-            email='demo@dantegpu.com', 
-            password='demo123456',
-            role='user'
-        )
-        try:
-            demo_user = create_user(db, user_in=demo_data)
-            print(f"Demo user created: {demo_user.username}")
-        except Exception as e:
-            print(f"Demo user may already exist: {e}")
-            
+        db.commit()
+        print("Default users ensured (admin, demo)")
     finally:
         db.close()
-    
+
     print("Database initialization complete!")
 
 if __name__ == "__main__":
-    init_database() 
\ No newline at end of file
+    init_database()